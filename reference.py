@@ -20,11 +20,17 @@ THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS  AS IS  AND
 """
 
 import argparse
-import array
+import collections
+import concurrent.futures
 import datetime
+import hashlib
+import os
+import queue
 import sys
+import threading
 import time
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageSequence
 import usb.core
 import usb.util
 
@@ -32,10 +38,18 @@ import usb.util
 VENDOR_ID = 0x320f
 PRODUCT_ID = 0x5055
 
+# USB transfer timeouts
+WRITE_TIMEOUT_MS = 10000
+READ_TIMEOUT_MS = 50000
+
 # Display dimensions
 DISPLAY_WIDTH = 240
 DISPLAY_HEIGHT = 135
 
+# Encoded frame sizes (RGB565, padded to a multiple of 0x8000 bytes)
+FRAME_PIXEL_BYTES = DISPLAY_WIDTH * DISPLAY_HEIGHT * 2
+FRAME_SIZE = (FRAME_PIXEL_BYTES + 0x7fff) & ~0x7fff
+
 # Configuration offsets
 DATE_OFFSET = 35
 DELAY_OFFSET = 43
@@ -45,6 +59,31 @@ FRAMES_2_OFFSET = 46
 # Default animation delay
 DEFAULT_ANIMATION_DELAY_MS = 100
 
+# Resampling filters selectable for resizing frames
+RESAMPLE_FILTERS = {
+    "bilinear": Image.Resampling.BILINEAR,
+    "lanczos": Image.Resampling.LANCZOS,
+    "nearest": Image.Resampling.NEAREST,
+}
+DEFAULT_RESAMPLE = "bilinear"
+
+# Upper bound on the default number of frame processing threads, which also
+# bounds how many full-size frames are held in memory at once
+MAX_DEFAULT_JOBS = 8
+
+# Number of commands sent ahead of their acknowledgements. Pipelining is
+# opt-in, as it relies on the firmware queueing commands.
+DEFAULT_COMMAND_WINDOW = 1
+
+# Used to clear the command buffer between commands
+_ZERO64 = bytes(64)
+
+# Zero padding sent after the pixel data of every frame
+_FRAME_PAD = bytes(FRAME_SIZE - FRAME_PIXEL_BYTES)
+
+# BCD encodings of 0-99
+_BCD_TABLE = bytes((n // 10) << 4 | (n % 10) for n in range(100))
+
 class Animation:
     """
     Handles the processing of image files into frames suitable for the display.
@@ -52,31 +91,50 @@ class Animation:
     This class opens an image or animated GIF, and processes each frame by
     resizing, cropping, and converting it to the correct format.
     """
-    def __init__(self, file_path):
+    def __init__(self, file_path, resample=RESAMPLE_FILTERS[DEFAULT_RESAMPLE], jobs=None):
         """
         Initializes the Animation object and processes the image file.
 
+        Frames are decoded in order, then resized and cropped on a pool of
+        threads, as PIL releases the GIL while doing so.
+
         Args:
             file_path (str): The path to the image file (GIF, PNG, etc.).
+            resample (PIL.Image.Resampling): The filter used to resize frames.
+            jobs (int): The number of threads processing frames. Defaults to
+                the number of CPUs, up to MAX_DEFAULT_JOBS.
         
         Raises:
             FileNotFoundError: If the specified file does not exist.
             ValueError: If the image file is invalid or contains no valid frames.
         """
         self.processed_frames = []
+        self.resample = resample
+        self._resize_sizes = {}
+        self._crop_boxes = {}
+        jobs = jobs or min(os.cpu_count() or 1, MAX_DEFAULT_JOBS)
         try:
-            with Image.open(file_path) as img:
-                n_frames = getattr(img, "n_frames", 1)
-
-                for i in range(n_frames):
-                    img.seek(i)
-                    frame = img.copy()
+            with Image.open(file_path) as img, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+                pending = collections.deque()
+                for i, frame in enumerate(ImageSequence.Iterator(img)):
                     if frame.width == 0 or frame.height == 0:
                         print(f"Skipping frame {i} due to invalid dimensions (0x0).")
                         continue
-                    
-                    processed_frame = self._process_frame(frame)
-                    self.processed_frames.append(processed_frame)
+
+                    # Seeking reuses the same image, so the conversion (which
+                    # also copies the frame) has to happen here. Converting
+                    # first expands a palette once per frame and lets the
+                    # resize filter work on RGB(A) data.
+                    has_alpha = frame.mode in ("RGBA", "LA", "PA") or "transparency" in frame.info
+                    rgb_frame = frame.convert("RGBA" if has_alpha else "RGB")
+                    pending.append(executor.submit(self._process_frame, rgb_frame))
+
+                    # Bound the number of full-size frames held in memory.
+                    if len(pending) >= 2 * jobs:
+                        self.processed_frames.append(pending.popleft().result())
+                while pending:
+                    self.processed_frames.append(pending.popleft().result())
         except FileNotFoundError:
             print(f"Error: The file '{file_path}' was not found.", file=sys.stderr)
             raise
@@ -86,24 +144,37 @@ class Animation:
 
     def _process_frame(self, frame):
         """
-        Resizes, crops, and converts a single image frame.
+        Resizes and crops a single image frame.
+
+        RGBA frames are resized with alpha, so Pillow blends them
+        premultiplied, and fully transparent pixels end up black.
 
         Args:
-            frame (PIL.Image.Image): The image frame to process.
+            frame (PIL.Image.Image): The RGB or RGBA image frame to process.
 
         Returns:
-            PIL.Image.Image: The processed frame in RGB format.
+            numpy.ndarray: The processed frame as a (height, width, 3) array
+            of RGB bytes.
         """
         resized_frame = self._resize(frame)
         cropped_frame = self._crop(resized_frame)
-        return cropped_frame.convert("RGB")
+        if cropped_frame.mode == "RGBA":
+            rgba = np.asarray(cropped_frame)
+            pixels = rgba[..., :3].copy()
+            # Filters that don't premultiply (NEAREST) keep the colour stored
+            # under transparent pixels.
+            pixels[rgba[..., 3] == 0] = 0
+            return pixels
+        return np.frombuffer(cropped_frame.tobytes(), dtype=np.uint8).reshape(
+            DISPLAY_HEIGHT, DISPLAY_WIDTH, 3)
 
     def _resize(self, frame):
         """
         Resizes a frame while maintaining aspect ratio.
 
         The frame is resized so that it can be cropped to the display dimensions
-        without distortion.
+        without distortion. The target size and crop box are computed once
+        per source size, which for the frames of a single GIF is constant.
 
         Args:
             frame (PIL.Image.Image): The image frame to resize.
@@ -111,35 +182,44 @@ class Animation:
         Returns:
             PIL.Image.Image: The resized frame.
         """
-        w_orig, h_orig = frame.size
-        aspect_ratio = w_orig / h_orig
-        
-        potential_width = int(DISPLAY_HEIGHT * aspect_ratio)
-
-        if potential_width > DISPLAY_WIDTH:
-            new_size = (potential_width, DISPLAY_HEIGHT)
-        else:
-            new_height = int(DISPLAY_WIDTH / aspect_ratio)
-            new_size = (DISPLAY_WIDTH, new_height)
-            
-        return frame.resize(new_size, Image.Resampling.LANCZOS)
+        new_size = self._resize_sizes.get(frame.size)
+        if new_size is None:
+            w_orig, h_orig = frame.size
+            aspect_ratio = w_orig / h_orig
+
+            potential_width = int(DISPLAY_HEIGHT * aspect_ratio)
+
+            if potential_width > DISPLAY_WIDTH:
+                new_size = (potential_width, DISPLAY_HEIGHT)
+            else:
+                new_height = int(DISPLAY_WIDTH / aspect_ratio)
+                new_size = (DISPLAY_WIDTH, new_height)
+
+            # Threads computing the same entry store identical values.
+            # Integer offsets keep the crop exactly the display size; Pillow
+            # rounds .5 coordinates half-to-even, which can lose or add a row.
+            w, h = new_size
+            left = (w - DISPLAY_WIDTH) // 2
+            top = (h - DISPLAY_HEIGHT) // 2
+            self._crop_boxes[new_size] = (
+                left, top, left + DISPLAY_WIDTH, top + DISPLAY_HEIGHT
+            )
+            self._resize_sizes[frame.size] = new_size
+
+        return frame.resize(new_size, self.resample)
 
     def _crop(self, frame):
         """
         Crops a frame to the center to match display dimensions.
 
         Args:
-            frame (PIL.Image.Image): The image frame to crop.
+            frame (PIL.Image.Image): The image frame to crop, as returned by
+                _resize.
 
         Returns:
             PIL.Image.Image: The cropped frame.
         """
-        w, h = frame.size
-        left = (w - DISPLAY_WIDTH) / 2
-        top = (h - DISPLAY_HEIGHT) / 2
-        right = (w + DISPLAY_WIDTH) / 2
-        bottom = (h + DISPLAY_HEIGHT) / 2
-        return frame.crop((left, top, right, bottom))
+        return frame.crop(self._crop_boxes[frame.size])
 
     def num_frames(self):
         """Returns the number of processed frames."""
@@ -153,9 +233,10 @@ class Animation:
             idx (int): The index of the frame to retrieve.
 
         Returns:
-            A sequence-like object containing the pixel data.
+            numpy.ndarray: The pixel data as a (height, width, 3) array of
+            RGB bytes.
         """
-        return self.processed_frames[idx].getdata()
+        return self.processed_frames[idx]
 
 class USBDevice:
     """A wrapper for pyusb to handle communication with the keyboard."""
@@ -198,16 +279,18 @@ class USBDevice:
         if self.ep_out is None or self.ep_in is None:
             raise IOError("Could not find USB endpoints.")
 
+        # Bound once, as these are called for every command.
+        self._write = self.ep_out.write
+        self._read = self.ep_in.read
+
     def write(self, data):
         """
         Writes data to the USB device.
 
         Args:
-            data (list or array.array): The data to write.
+            data (bytes-like): The full 64-byte report to write.
         """
-        if len(data) < 64:
-            data.extend([0] * (64 - len(data)))
-        self.ep_out.write(data)
+        self._write(data, WRITE_TIMEOUT_MS)
 
     def read(self, size=8):
         """
@@ -219,7 +302,7 @@ class USBDevice:
         Returns:
             array.array: The data read from the device.
         """
-        return self.ep_in.read(size, timeout=50000)
+        return self._read(size, READ_TIMEOUT_MS)
 
     def close(self):
         """Releases the USB device interface and reattaches the kernel driver."""
@@ -234,16 +317,20 @@ class Keyboard:
     """
     Represents the Zuoya GMK87 keyboard and handles high-level operations.
     """
-    def __init__(self, usb_device):
+    def __init__(self, usb_device, window=DEFAULT_COMMAND_WINDOW):
         """
         Initializes the Keyboard object.
 
         Args:
             usb_device (USBDevice): An initialized USBDevice object.
+            window (int): The number of commands kept in flight when sending
+                a sequence of commands. 1 waits for every command in turn.
         """
         self.usb = usb_device
-        self.config = []
+        self.window = window
+        self.config = bytearray()
         self.config_needs_update = False
+        self._cmd_buf = bytearray(64)
 
     def close(self):
         """Closes the connection to the keyboard."""
@@ -255,7 +342,7 @@ class Keyboard:
 
         Args:
             command_id (int): The ID of the command to send.
-            data (list): The payload of the command.
+            data (list or bytes-like): The payload of the command.
             pos (int): The position/offset for the command.
 
         Returns:
@@ -274,8 +361,23 @@ class Keyboard:
         if command_id == 2:
             time.sleep(0.1)
 
-        buffer = [0x00] * 64
-        buffer[0] = 0x04
+        expected = self._submit_command(command_id, data, pos)
+        return self._read_response(expected)
+
+    def _submit_command(self, command_id, data, pos):
+        """
+        Writes a command to the keyboard without waiting for its response.
+
+        Args:
+            command_id (int): The ID of the command to send.
+            data (list or bytes-like): The payload of the command.
+            pos (int): The position/offset for the command.
+
+        Returns:
+            bytes: The header bytes the matching response will echo.
+        """
+        buffer = self._cmd_buf
+        buffer[:] = _ZERO64
         buffer[3] = command_id
         buffer[4] = len(data)
         buffer[5] = pos & 0xff
@@ -284,31 +386,87 @@ class Keyboard:
 
         buffer[8:8+len(data)] = data
 
-        checksum = sum(buffer[3:])
+        # Bytes 0-2 are still zero here, so summing the whole buffer gives
+        # the sum of bytes 3..63.
+        checksum = sum(buffer)
+        buffer[0] = 0x04
         buffer[1] = checksum & 0xff
         buffer[2] = (checksum >> 8) & 0xff
 
         self.usb.write(buffer)
+        return bytes(buffer[0:3])
+
+    def _read_response(self, expected, in_order=False):
+        """
+        Reads responses until one matches a previously submitted command.
+
+        Args:
+            expected (bytes): The header bytes returned by
+                _submit_command.
+            in_order (bool): Whether the next response must match. Set when
+                several commands are in flight, where skipping a response
+                would consume the acknowledgement of a later command.
+
+        Returns:
+            array.array: The response payload.
 
+        Raises:
+            IOError: If in_order is set and the response does not match.
+        """
         while True:
             response = self.usb.read()
-            if response[0:3] == array.array('B', buffer[0:3]):
+            if memoryview(response)[:3] == expected:
                 return response[4:]
+            if in_order:
+                raise IOError(
+                    f"Expected a response to {expected.hex()}, "
+                    f"got {response[0:3].tobytes().hex()}."
+                )
+
+    def _send_pipelined(self, commands):
+        """
+        Sends a sequence of commands, keeping up to `self.window` in flight.
+
+        With more than one command in flight, each response must answer the
+        oldest outstanding command.
+
+        Args:
+            commands (iterable): (command_id, data, pos) tuples to send.
+
+        Yields:
+            array.array: The response payload of each command, in order.
+
+        Raises:
+            IOError: If a response arrives out of order.
+        """
+        in_order = self.window > 1
+        in_flight = collections.deque()
+        for command_id, data, pos in commands:
+            in_flight.append(self._submit_command(command_id, data, pos))
+            if len(in_flight) >= self.window:
+                yield self._read_response(in_flight.popleft(), in_order)
+        while in_flight:
+            yield self._read_response(in_flight.popleft(), in_order)
 
     def load_config(self):
         """Loads the current configuration from the keyboard."""
         self.send_command(1)
 
         # The purpose of this is unknown, but it is part of the protocol.
-        for i in range(9):
-            self.send_command(command_id=3, data=[0x00] * 4, pos=i*4)
-        self.send_command(command_id=3, data=[0x00], pos=36)
+        # The device only echoes 4 bytes per response and the vendor software
+        # uses the same 4-byte chunks, so they are not merged. They are sent
+        # lock-step unless the command window was raised with --window.
+        prep = [(3, [0x00] * 4, i*4) for i in range(9)]
+        prep.append((3, [0x00], 36))
+        for _ in self._send_pipelined(prep):
+            pass
 
         self.send_command(2)
 
-        buffer=[]
-        for i in range(12):
-            buffer.extend(self.send_command(command_id=5, data=[0x00] * 4, pos=i*4))
+        buffer = bytearray()
+        reads = ((5, [0x00] * 4, i*4) for i in range(12))
+        for response in self._send_pipelined(reads):
+            buffer.extend(response)
 
         self.config_needs_update = False
         self.config = buffer
@@ -328,7 +486,7 @@ class Keyboard:
         """
         if not 0 <= n <= 99:
             raise ValueError("Input for BCD conversion must be between 0 and 99")
-        return (n // 10) << 4 | (n % 10)
+        return _BCD_TABLE[n]
 
     def set_datetime(self):
         """Sets the keyboard's date and time to the current system time."""
@@ -336,14 +494,19 @@ class Keyboard:
             self.load_config()
 
         now = datetime.datetime.now()
-       
-        self.config[DATE_OFFSET] = self._int_to_bcd(now.second)
-        self.config[DATE_OFFSET + 1] = self._int_to_bcd(now.minute)
-        self.config[DATE_OFFSET + 2] = self._int_to_bcd(now.hour)
-        self.config[DATE_OFFSET + 3] = now.isoweekday()
-        self.config[DATE_OFFSET + 4] = self._int_to_bcd(now.day)
-        self.config[DATE_OFFSET + 5] = self._int_to_bcd(now.month)
-        self.config[DATE_OFFSET + 6] = self._int_to_bcd(now.year - 2000)
+
+        # Layout: second, minute, hour, weekday, day, month, year (BCD except
+        # the weekday). Only the year can fall outside 0-99, so it alone is
+        # range checked.
+        self.config[DATE_OFFSET:DATE_OFFSET + 7] = bytes((
+            _BCD_TABLE[now.second],
+            _BCD_TABLE[now.minute],
+            _BCD_TABLE[now.hour],
+            now.isoweekday(),
+            _BCD_TABLE[now.day],
+            _BCD_TABLE[now.month],
+            self._int_to_bcd(now.year - 2000),
+        ))
 
         self.config_needs_update = True
 
@@ -395,41 +558,137 @@ class Keyboard:
         Encodes a frame into RGB565 format.
 
         Args:
-            frame: The frame data to encode.
+            frame (numpy.ndarray): The (height, width, 3) RGB pixel data to encode.
 
         Returns:
-            array.array: The encoded frame data.
+            numpy.ndarray: The FRAME_PIXEL_BYTES bytes of encoded pixel data.
+            The padding up to FRAME_SIZE is added during upload.
         """
-        frame_size = ((DISPLAY_WIDTH * DISPLAY_HEIGHT * 2) + 0x7fff) & ~0x7fff
-        frame_buffer = array.array('B', [0x00] * frame_size)
+        frame_buffer = np.empty(FRAME_PIXEL_BYTES, dtype=np.uint8)
+
+        # Pillow has no raw packer from RGB to any 16-bit layout, so the
+        # packing is done here.
+        val = (frame[..., 0] >> 3).astype(np.uint16)
+        val <<= 11
+        val |= (frame[..., 1] >> 2).astype(np.uint16) << 5
+        val |= frame[..., 2] >> 3
 
-        for idx, pixel in enumerate(frame):
-           r = (pixel[0] >> 3) & 0x1F
-           g = (pixel[1] >> 2) & 0x3F
-           b = (pixel[2] >> 3) & 0x1F
-           val = (r << 11) | (g << 5) | b
-           frame_buffer[idx*2] = (val >> 8) & 0xff
-           frame_buffer[idx*2+1] = val & 0xff
+        # The display expects each pixel as a big-endian 16-bit value.
+        if sys.byteorder == "little":
+            val.byteswap(inplace=True)
+        frame_buffer[:] = val.reshape(-1).view(np.uint8)
 
         return frame_buffer
 
+    def _encode_frames(self, frames, encoded_queue, stop):
+        """
+        Encodes frames in order and puts them on a queue.
+
+        Runs on a background thread during upload_frames. Puts None once all
+        frames are encoded, or the exception that stopped encoding. Returns
+        early once `stop` is set, so a failed upload does not leave the
+        thread blocked on a full queue.
+
+        Args:
+            frames (list): The frames to encode, as returned by get_frame.
+            encoded_queue (queue.Queue): The queue receiving encoded frames.
+            stop (threading.Event): Set when nothing reads the queue anymore.
+        """
+        def put(item):
+            while not stop.is_set():
+                try:
+                    encoded_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            # Animations often hold a frame for several steps, so a frame
+            # identical to the previous one reuses its encoding. Only the
+            # previous frame is kept, so memory does not grow with the
+            # number of frames.
+            previous_key = previous_encoded = None
+            for frame in frames:
+                key = hashlib.blake2b(frame, digest_size=16).digest()
+                if key != previous_key:
+                    previous_key = key
+                    previous_encoded = self.encode_frame(frame)
+                if not put(previous_encoded):
+                    return
+        except Exception as e:
+            put(e)
+        else:
+            put(None)
+
+    def _iter_chunks(self, encoded_queue):
+        """
+        Splits the encoded frames from a queue into upload-sized chunks.
+
+        Each frame is followed by the shared zero padding, and the frames are
+        treated as one contiguous stream, so a chunk may span the end of one
+        frame and the start of the next.
+
+        Args:
+            encoded_queue (queue.Queue): The queue filled by _encode_frames.
+
+        Yields:
+            tuple: The chunk data (bytes-like, at most 56 bytes) and its
+            position in the stream.
+        """
+        pos = 0
+        carry = bytearray()
+        while True:
+            encoded = encoded_queue.get()
+            if encoded is None:
+                break
+            if isinstance(encoded, Exception):
+                raise encoded
+
+            for segment in (encoded, _FRAME_PAD):
+                # Slicing a memoryview avoids copying the frame for every chunk.
+                data = memoryview(segment)
+                start = 0
+                if carry:
+                    start = min(56 - len(carry), len(data))
+                    carry += data[:start]
+                    if len(carry) < 56:
+                        continue
+                    yield carry, pos
+                    pos += 56
+                end = start + (len(data) - start) // 56 * 56
+                for i in range(start, end, 56):
+                    yield data[i:i+56], pos
+                    pos += 56
+                carry = bytearray(data[end:])
+
+        if carry:
+            yield carry, pos
+
     def upload_frames(self, first, second, verbose=False):
         """
         Uploads frames from two Animation objects to the keyboard.
 
+        Frames are encoded on a background thread while earlier frames are
+        being sent, so only a few encoded frames are held in memory at once.
+        Data commands are sent with up to `self.window` in flight.
+
         Args:
             first (Animation): The first animation.
             second (Animation): The second animation.
             verbose (bool): Whether to print verbose output.
         """
+        frames = [first.get_frame(i) for i in range(first.num_frames())]
+        frames += [second.get_frame(i) for i in range(second.num_frames())]
+
         if verbose:
             print("Encoding frames...")
-        
-        data = array.array('B', [])
-        for i in range(first.num_frames()):
-            data.extend(self.encode_frame(first.get_frame(i)))
-        for i in range(second.num_frames()):
-            data.extend(self.encode_frame(second.get_frame(i)))
+
+        encoded_queue = queue.Queue(maxsize=2)
+        stop = threading.Event()
+        threading.Thread(
+            target=self._encode_frames, args=(frames, encoded_queue, stop), daemon=True
+        ).start()
 
         if verbose:
             print("Starting upload...")
@@ -437,17 +696,25 @@ class Keyboard:
         self.send_command(0x23)
         self.send_command(1)
 
-        pos = 0
-        total = len(data)
+        total = len(frames) * FRAME_SIZE
         last_progress = -1
-        while pos < total:
-            size = min(56, total - pos)
-            self.send_command(command_id=0x21, data=data[pos:pos+size], pos=pos)
-            pos += size
-            progress = int((pos / total) * 100)
-            if progress > last_progress:
-                print(f"Upload progress: {progress}%", end="\r")
-                last_progress = progress
+        chunks = ((0x21, chunk, pos) for chunk, pos in self._iter_chunks(encoded_queue))
+        try:
+            for i, _ in enumerate(self._send_pipelined(chunks), 1):
+                progress = int((min(i * 56, total) / total) * 100)
+                if progress > last_progress:
+                    print(f"Upload progress: {progress}%", end="\r")
+                    last_progress = progress
+        except Exception as e:
+            # An encoding error surfaces here, after 0x23 was sent. Close the
+            # session so the keyboard does not stay unresponsive. After a USB
+            # error the device cannot be reached, so nothing is sent.
+            if not isinstance(e, usb.core.USBError):
+                print(file=sys.stderr)
+                self.send_command(2)
+            raise
+        finally:
+            stop.set()
         print("\nUpload complete.")
 
         self.send_command(2)
@@ -466,6 +733,28 @@ class Keyboard:
         print("Keyboard reset to default configuration.")
 
 
+def _positive_int(value):
+    """
+    Parses a command line value that must be an integer of at least 1.
+
+    Args:
+        value (str): The value to parse.
+
+    Returns:
+        int: The parsed value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 def main():
     """The main entry point of the script."""
     parser = argparse.ArgumentParser(
@@ -488,6 +777,27 @@ def main():
         default=DEFAULT_ANIMATION_DELAY_MS,
         type=int
     )
+    parser.add_argument(
+        "--resample",
+        help=f"The filter used to resize frames. 'bilinear' is much faster than 'lanczos'\n"
+             f"and usually indistinguishable at the display's size. Default: {DEFAULT_RESAMPLE}",
+        choices=RESAMPLE_FILTERS,
+        default=DEFAULT_RESAMPLE
+    )
+    parser.add_argument(
+        "--jobs",
+        help=f"The number of threads used to process image frames.\n"
+             f"Default: number of CPUs, at most {MAX_DEFAULT_JOBS}",
+        type=_positive_int
+    )
+    parser.add_argument(
+        "--window",
+        help=f"The number of commands sent before waiting for an acknowledgement.\n"
+             f"Values above 1 pipeline commands, which needs firmware that queues them.\n"
+             f"Default: {DEFAULT_COMMAND_WINDOW}",
+        default=DEFAULT_COMMAND_WINDOW,
+        type=_positive_int
+    )
     parser.add_argument(
         "--time-only",
         help="Set the clock only.",
@@ -511,7 +821,7 @@ def main():
     try:
         if args.verbose:
             print("Connecting to keyboard...")
-        keyboard = Keyboard(usb_device=USBDevice())
+        keyboard = Keyboard(usb_device=USBDevice(), window=args.window)
     except (ValueError, IOError) as e:
         print(f"Error connecting to keyboard: {e}", file=sys.stderr)
         sys.exit(1)
@@ -530,10 +840,10 @@ def main():
     try:
         if args.verbose:
             print(f"Processing first image: {args.first}")
-        first = Animation(args.first)
+        first = Animation(args.first, RESAMPLE_FILTERS[args.resample], args.jobs)
         if args.verbose:
             print(f"Processing second image: {args.second}")
-        second = Animation(args.second)
+        second = Animation(args.second, RESAMPLE_FILTERS[args.resample], args.jobs)
     except (FileNotFoundError, ValueError) as e:
         print(f"Error processing images: {e}", file=sys.stderr)
         sys.exit(1)